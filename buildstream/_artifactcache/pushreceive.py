@@ -43,6 +43,10 @@ from gi.repository import GLib, Gio, OSTree  # nopep8
 PROTO_VERSION = 1
 HEADER_SIZE = 5
 
+# Bound once here instead of going through the root
+# logger helpers on every log line
+logger = logging.getLogger(__name__)
+
 
 # An error occurred
 class PushException(Exception):
@@ -82,9 +86,13 @@ def sys_byteorder(msg_byteorder):
                             % msg_byteorder)
 
 
-def ostree_object_path(repo, obj):
+def ostree_objects_dir(repo):
     repodir = repo.get_path().get_path()
-    return os.path.join(repodir, 'objects', obj[0:2], obj[2:])
+    return os.path.join(repodir, 'objects')
+
+
+def ostree_object_path(objdir, obj):
+    return os.path.join(objdir, obj[0:2], obj[2:])
 
 
 class PushCommand(object):
@@ -175,7 +183,7 @@ class PushMessageWriter(object):
 
     def send_putobjects(self, repo, objects):
 
-        logging.info('Sending {} objects'.format(len(objects)))
+        logger.info('Sending {} objects'.format(len(objects)))
 
         # Send command saying we're going to send a stream of objects
         cmdtype = PushCommandType.putobjects
@@ -184,10 +192,11 @@ class PushMessageWriter(object):
 
         # Open a TarFile for writing uncompressed tar to a stream
         tar = tarfile.TarFile.open(mode='w|', fileobj=self.file)
+        objdir = ostree_objects_dir(repo)
         for obj in objects:
 
-            logging.info('Sending object {}'.format(obj))
-            objpath = ostree_object_path(repo, obj)
+            logger.info('Sending object %s', obj)
+            objpath = ostree_object_path(objdir, obj)
             stat = os.stat(objpath)
 
             tar_info = tarfile.TarInfo(obj)
@@ -389,7 +398,7 @@ class OSTreePusher(object):
             ssh_cmd += ['--debug']
         ssh_cmd += [self.remote_repo]
 
-        logging.info('Executing {}'.format(' '.join(ssh_cmd)))
+        logger.info('Executing {}'.format(' '.join(ssh_cmd)))
         self.ssh = subprocess.Popen(ssh_cmd, stdin=subprocess.PIPE,
                                     stdout=subprocess.PIPE,
                                     stderr=self.output,
@@ -420,6 +429,7 @@ class OSTreePusher(object):
 
     def needed_objects(self, commits):
         objects = set()
+        objdir = ostree_objects_dir(self.repo)
         for rev in commits:
             _, reachable = self.repo.traverse_commit(rev, 0, None)
             for obj in reachable:
@@ -430,14 +440,14 @@ class OSTreePusher(object):
                 elif obj[1] == OSTree.ObjectType.COMMIT:
                     # Add in detached metadata
                     metaobj = objname + 'meta'
-                    metapath = ostree_object_path(self.repo, metaobj)
+                    metapath = ostree_object_path(objdir, metaobj)
                     if os.path.exists(metapath):
                         objects.add(metaobj)
 
                     # Add in Endless compat files
                     for suffix in ['sig', 'sizes2']:
                         metaobj = obj[0] + '.' + suffix
-                        metapath = ostree_object_path(self.repo, metaobj)
+                        metapath = ostree_object_path(objdir, metaobj)
                         if os.path.exists(metapath):
                             objects.add(metaobj)
                 objects.add(objname)
@@ -455,7 +465,7 @@ class OSTreePusher(object):
         self.writer.send_info(self.repo, list(self.refs.keys()))
 
         # Receive remote info
-        logging.info('Receiving repository information')
+        logger.info('Receiving repository information')
         args = self.reader.receive_info()
         remote_mode = args['mode']
         if remote_mode != OSTree.RepoMode.ARCHIVE_Z2:
@@ -466,12 +476,12 @@ class OSTreePusher(object):
             if rev != remote_rev:
                 update_refs[branch] = remote_rev, rev
         if len(update_refs) == 0:
-            logging.info('Nothing to update')
+            logger.info('Nothing to update')
             self.writer.send_done()
             return self.close()
 
         # Send update command
-        logging.info('Sending update request')
+        logger.info('Sending update request')
         self.writer.send_update(update_refs)
 
         # Receive status for update request
@@ -485,7 +495,7 @@ class OSTreePusher(object):
         exc_info = None
         ref_count = 0
         for branch, revs in update_refs.items():
-            logging.info('Updating {} {} to {}'.format(branch, revs[0], revs[1]))
+            logger.info('Updating {} {} to {}'.format(branch, revs[0], revs[1]))
             try:
                 self.needed_commits(revs[0], revs[1], commits)
                 ref_count += 1
@@ -497,7 +507,7 @@ class OSTreePusher(object):
         if ref_count == 0 and exc_info:
             raise exc_info[0].with_traceback(exc_info[1], exc_info[2])
 
-        logging.info('Enumerating objects to send')
+        logger.info('Enumerating objects to send')
         objects = self.needed_objects(commits)
 
         # Send all the objects to receiver, checking status after each
@@ -569,7 +579,7 @@ class OSTreeReceiver(object):
                                              PushCommandType.done])
 
         if cmdtype == PushCommandType.done:
-            logging.debug('Received done before any objects, exiting')
+            logger.debug('Received done before any objects, exiting')
             return 0
 
         # Receive the actual objects
@@ -583,11 +593,12 @@ class OSTreeReceiver(object):
             return 0
 
         # Got all objects, move them to the object store
+        objdir = ostree_objects_dir(self.repo)
         for obj in received_objects:
             tmp_path = os.path.join(self.tmpdir, obj)
-            obj_path = ostree_object_path(self.repo, obj)
+            obj_path = ostree_object_path(objdir, obj)
             os.makedirs(os.path.dirname(obj_path), exist_ok=True)
-            logging.debug('Renaming {} to {}'.format(tmp_path, obj_path))
+            logger.debug('Renaming %s to %s', tmp_path, obj_path)
             os.rename(tmp_path, obj_path)
 
         # Verify that we have the specified commit objects
@@ -598,7 +609,7 @@ class OSTreeReceiver(object):
 
         # Finally, update the refs
         for branch, revs in update_refs.items():
-            logging.debug('Setting ref {} to {}'.format(branch, revs[1]))
+            logger.debug('Setting ref {} to {}'.format(branch, revs[1]))
             self.repo.set_ref_immediate(None, branch, revs[1], None)
 
         # Inform pusher that everything is in place
@@ -684,7 +695,7 @@ def push(repo, remote, remote_port, branches, output):
         except PushExistsException:
             # If the commit already existed, just bail out
             # on the push and dont bother re-raising the error
-            logging.info("Ref {} was already present in remote {}".format(branches, remote))
+            logger.info("Ref {} was already present in remote {}".format(branches, remote))
             terminate_push()
             return False
 
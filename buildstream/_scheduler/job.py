@@ -366,6 +366,11 @@ class Job():
         if message.message_type == MessageType.LOG:
             return
 
+        # The frontend only displays status messages in verbose mode,
+        # dont pay for sending them over the queue otherwise
+        if message.message_type == MessageType.STATUS and not context.log_verbose:
+            return
+
         self.queue.put(Envelope('message', message))
 
     #######################################################
@@ -148,31 +148,44 @@ class Queue():
             return
 
         # Place skipped elements directly on the done queue
-        elts = list(elts)
-        skip = [elt for elt in elts if self.skip(elt)]
-        wait = [elt for elt in elts if elt not in skip]
-
-        self.wait_queue.extend(wait)
-        self.done_queue.extend(skip)
-        self.skipped_elements.extend(skip)
+        wait_append = self.wait_queue.append
+        done_append = self.done_queue.append
+        skipped_append = self.skipped_elements.append
+        should_skip = self.skip
+
+        for elt in elts:
+            if should_skip(elt):
+                done_append(elt)
+                skipped_append(elt)
+            else:
+                wait_append(elt)
 
+    # Hand over everything processed so far in one go, swapping
+    # in a fresh done queue rather than popping them one by one
     def dequeue(self):
-        while len(self.done_queue) > 0:
-            yield self.done_queue.popleft()
+        done, self.done_queue = self.done_queue, deque()
+        return done
 
     def process_ready(self):
         scheduler = self.scheduler
         unready = []
 
-        while len(self.wait_queue) > 0 and scheduler.get_job_token(self.queue_type):
+        # A token is held across elements which turn out to not
+        # need a job, and only consumed when a job is spawned
+        have_token = False
+
+        while len(self.wait_queue) > 0:
+            if not have_token:
+                have_token = scheduler.get_job_token(self.queue_type)
+                if not have_token:
+                    break
+
             element = self.wait_queue.popleft()
 
             if not self.ready(element):
-                scheduler.put_job_token(self.queue_type)
                 unready.append(element)
                 continue
             elif self.skip(element):
-                scheduler.put_job_token(self.queue_type)
                 self.done_queue.append(element)
                 self.skipped_elements.append(element)
                 continue
@@ -182,6 +195,11 @@ class Queue():
 
             job.spawn(self.process, self.job_done, self.max_retries)
             self.active_jobs.append(job)
+            have_token = False
+
+        # Give back the token if it was not used for a job
+        if have_token:
+            scheduler.put_job_token(self.queue_type)
 
         # These were not ready but were in the beginning, give em
         # first priority again next time around
@@ -326,8 +326,7 @@ class Scheduler():
                 queue.enqueue(elements)
 
                 # Dequeue processed elements for the next queue
-                elements = list(queue.dequeue())
-                elements = list(elements)
+                elements = queue.dequeue()
 
             # Kickoff whatever processes can be processed at this time
             #
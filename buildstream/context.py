@@ -263,7 +263,7 @@ class Context():
 
         # Tag message only once
         if message.depth is None:
-            message.depth = len(list(self._message_depth))
+            message.depth = len(self._message_depth)
 
         # Send it off to the log handler (can be the frontend,
         # or it can be the child task which will log and propagate
@@ -172,9 +172,15 @@ def sha256sum(filename):
        OSError: In the case there was an issue opening
                 or reading `filename`
     """
-    h = hashlib.sha256()
     with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+
+        # Where available, let hashlib run the read loop in C
+        # without holding the GIL
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b""):
             h.update(chunk)
 
     return h.hexdigest()
@@ -146,5 +146,6 @@ setup(name='BuildStream',
                      'pytest-env',
                      'pytest-pep8',
                      'pytest-cov',
+                     'pytest-xdist',
                      'pytest'],
       zip_safe=False)
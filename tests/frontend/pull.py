@@ -24,6 +24,18 @@ def assert_shared(cli, share, project, element_name):
                              .format(share.repo, element_name))
 
 
+# Assert that the artifacts of a target and all of its
+# dependencies are in the share
+#
+def assert_all_shared(cli, share, project, target):
+    keys = cli.get_element_keys(project, target)
+    shared = share.has_artifacts('test', keys)
+    for element_name, is_shared in shared.items():
+        if not is_shared:
+            raise AssertionError("Artifact share at {} does not contain the expected element {}"
+                                 .format(share.repo, element_name))
+
+
 @pytest.mark.datafiles(DATA_DIR)
 def test_push_pull(cli, tmpdir, datafiles):
     project = os.path.join(datafiles.dirname, datafiles.basename)
@@ -115,8 +127,7 @@ def test_push_pull_all(cli, tmpdir, datafiles):
 
     # And finally assert that the artifact is in the share
     all_elements = ['target.bst', 'import-bin.bst', 'import-dev.bst', 'compose-all.bst']
-    for element_name in all_elements:
-        assert_shared(cli, share, project, element_name)
+    assert_all_shared(cli, share, project, 'target.bst')
 
     # Make sure we update the summary in our artifact share,
     # we dont have a real server around to do it
@@ -131,15 +142,15 @@ def test_push_pull_all(cli, tmpdir, datafiles):
 
     # Assert that we are now in a downloadable state, nothing
     # is cached locally anymore
+    states = cli.get_element_states(project, 'target.bst')
     for element_name in all_elements:
-        state = cli.get_element_state(project, element_name)
-        assert state == 'downloadable'
+        assert states[element_name] == 'downloadable'
 
     # Now try bst pull
     result = cli.run(project=project, args=['pull', '--deps', 'all', 'target.bst'])
     assert result.exit_code == 0
 
     # And assert that it's again in the local cache, without having built
+    states = cli.get_element_states(project, 'target.bst')
     for element_name in all_elements:
-        state = cli.get_element_state(project, element_name)
-        assert state == 'cached'
+        assert states[element_name] == 'cached'
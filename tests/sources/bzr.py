@@ -13,6 +13,9 @@ DATA_DIR = os.path.join(
     'bzr',
 )
 
+# Every test in this module needs the host tool
+pytestmark = pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
+
 
 class BzrSetup(Setup):
     bzr_env = {"BZR_EMAIL": "Testy McTesterson <testy.mctesterson@example.com>"}
@@ -57,7 +60,6 @@ class BzrSetup(Setup):
 
 # Test that the source can be parsed meaningfully.
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'basic'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_create_source(tmpdir, datafiles):
     setup = Setup(datafiles, 'target.bst', tmpdir)
     assert(setup.source.get_kind() == 'bzr')
@@ -68,7 +70,6 @@ def test_create_source(tmpdir, datafiles):
 
 # Test that without ref, consistency is set appropriately.
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'basic-no-ref'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_no_ref(tmpdir, datafiles):
     setup = Setup(datafiles, 'target.bst', tmpdir)
     assert(setup.source.get_consistency() == Consistency.INCONSISTENT)
@@ -76,7 +77,6 @@ def test_no_ref(tmpdir, datafiles):
 
 # Test that with ref, consistency is resolved
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'basic'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_consistency_resolved(tmpdir, datafiles):
     setup = BzrSetup(datafiles, 'target.bst', tmpdir)
     assert(setup.source.get_consistency() == Consistency.RESOLVED)
@@ -84,7 +84,6 @@ def test_consistency_resolved(tmpdir, datafiles):
 
 # Test that with ref and fetching, consistency is cached
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'fetch'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_consistency_cached(tmpdir, datafiles):
     setup = BzrSetup(datafiles, 'target.bst', tmpdir)
     repodir = os.path.join(str(datafiles), 'foo')
@@ -103,7 +102,6 @@ def test_consistency_cached(tmpdir, datafiles):
 
 # Test that without track, consistency is set appropriately.
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'basic-no-track'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_no_track(tmpdir, datafiles):
     with pytest.raises(LoadError):
         setup = Setup(datafiles, 'target.bst', tmpdir)
@@ -111,7 +109,6 @@ def test_no_track(tmpdir, datafiles):
 
 # Test that when I fetch, it ends up in the cache.
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'fetch'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_fetch(tmpdir, datafiles):
     # Pretty long setup
     setup = BzrSetup(datafiles, 'target.bst', tmpdir)
@@ -132,7 +129,6 @@ def test_fetch(tmpdir, datafiles):
 
 # Test that staging fails without ref
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'fetch'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_stage_bad_ref(tmpdir, datafiles):
     # Pretty long setup
     setup = BzrSetup(datafiles, 'target-bad-ref.bst', tmpdir)
@@ -153,7 +149,6 @@ def test_stage_bad_ref(tmpdir, datafiles):
 
 # Test that I can stage the repo successfully
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'fetch'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_stage(tmpdir, datafiles):
     # Pretty long setup
     setup = BzrSetup(datafiles, 'target.bst', tmpdir)
@@ -177,7 +172,6 @@ def test_stage(tmpdir, datafiles):
 
 # Test that I can track the branch
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'fetch'))
-@pytest.mark.skipif(HAVE_BZR is False, reason="`bzr` is not available")
 def test_track(tmpdir, datafiles):
     # Pretty long setup
     setup = BzrSetup(datafiles, 'target-bad-ref.bst', tmpdir)
@@ -16,6 +16,9 @@ DATA_DIR = os.path.join(
     'git',
 )
 
+# Every test in this module needs the host tool
+pytestmark = pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
+
 
 ###############################################################
 #                         Utilities                           #
@@ -132,14 +135,12 @@ def git_add_submodule(setup, reponame, url, path):
 ###############################################################
 #                            Tests                            #
 ###############################################################
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'basic'))
 def test_create_source(tmpdir, datafiles):
     setup = Setup(datafiles, 'target.bst', tmpdir)
     assert(setup.source.get_kind() == 'git')
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_unique_key(tmpdir, datafiles):
 
@@ -154,7 +155,6 @@ def test_unique_key(tmpdir, datafiles):
     assert(unique_key[1] == '12345')
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_fetch(tmpdir, datafiles):
 
@@ -177,7 +177,6 @@ def test_fetch(tmpdir, datafiles):
     assert(os.path.isdir(fullpath))
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_fetch_bad_ref(tmpdir, datafiles):
 
@@ -197,7 +196,6 @@ def test_fetch_bad_ref(tmpdir, datafiles):
         setup.source.fetch()
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_stage(tmpdir, datafiles):
 
@@ -218,7 +216,6 @@ def test_stage(tmpdir, datafiles):
     assert(os.path.exists(os.path.join(stagedir, 'file.txt')))
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_fetch_new_ref_and_stage(tmpdir, datafiles):
 
@@ -255,7 +252,6 @@ def test_fetch_new_ref_and_stage(tmpdir, datafiles):
     assert(os.path.exists(os.path.join(stagedir, 'anotherfile.txt')))
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_track(tmpdir, datafiles):
 
@@ -278,7 +274,6 @@ def test_track(tmpdir, datafiles):
     assert(new_ref == '3ac9cce94dd57e50a101e03dd6d43e0fc8a56b95')
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_submodule_fetch(tmpdir, datafiles):
 
@@ -306,7 +301,6 @@ def test_submodule_fetch(tmpdir, datafiles):
     assert(os.path.isdir(fullpath))
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_submodule_stage(tmpdir, datafiles):
 
@@ -337,7 +331,6 @@ def test_submodule_stage(tmpdir, datafiles):
     assert(os.path.exists(os.path.join(stagedir, 'subrepo', 'ponyfile.txt')))
 
 
-@pytest.mark.skipif(HAVE_GIT is False, reason="git is not available")
 @pytest.mark.datafiles(os.path.join(DATA_DIR, 'template'))
 def test_fetch_new_ref_with_submodule(tmpdir, datafiles):
 
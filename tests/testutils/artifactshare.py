@@ -72,6 +72,41 @@ class ArtifactShare():
     # Returns:
     #    (bool): True if the artifact exists in the share, otherwise false.
     def has_artifact(self, project_name, element_name, cache_key):
+        artifact_key = self._artifact_key(project_name, element_name, cache_key)
+
+        if not subprocess.call(['ostree', 'rev-parse',
+                                '--repo', self.repo,
+                                artifact_key]):
+            return True
+
+        return False
+
+    # has_artifacts():
+    #
+    # Checks whether each of the given artifacts is present in
+    # the share, listing the share's refs only once
+    #
+    # Args:
+    #    project_name (str): The project name
+    #    cache_keys (dict): The cache keys, keyed by element name
+    #
+    # Returns:
+    #    (dict): Whether each artifact exists in the share, keyed by element name
+    def has_artifacts(self, project_name, cache_keys):
+        output = subprocess.check_output(['ostree', 'refs',
+                                          '--repo', self.repo])
+        refs = set(output.decode('utf-8').splitlines())
+
+        return {
+            element_name: self._artifact_key(project_name, element_name, cache_key) in refs
+            for element_name, cache_key in cache_keys.items()
+        }
+
+    # _artifact_key():
+    #
+    # Composes the ref under which an artifact is stored in the share
+    #
+    def _artifact_key(self, project_name, element_name, cache_key):
 
         # NOTE: This should be kept in line with our ostree
         #       based artifact cache code, the below is the
@@ -87,14 +122,7 @@ class ArtifactShare():
             x if x in valid_chars else '_'
             for x in element_name
         ])
-        artifact_key = '{0}/{1}/{2}'.format(project_name, element_name, cache_key)
-
-        if not subprocess.call(['ostree', 'rev-parse',
-                                '--repo', self.repo,
-                                artifact_key]):
-            return True
-
-        return False
+        return '{0}/{1}/{2}'.format(project_name, element_name, cache_key)
 
 
 # create_artifact_share()
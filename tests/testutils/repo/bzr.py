@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 import subprocess
 import pytest
@@ -25,8 +26,15 @@ class Bzr(Repo):
         subprocess.call(['bzr', 'init', branch_dir], env=BZR_ENV)
         self.copy_directory(directory, branch_dir)
         subprocess.call(['bzr', 'add', '.'], env=BZR_ENV, cwd=branch_dir)
-        subprocess.call(['bzr', 'commit', '--message="Initial commit"'],
-                        env=BZR_ENV, cwd=branch_dir)
+        output = subprocess.check_output(['bzr', 'commit', '--message="Initial commit"'],
+                                         env=BZR_ENV, cwd=branch_dir,
+                                         stderr=subprocess.STDOUT)
+
+        # Take the revno from the commit report rather than
+        # spawning bzr once more to ask for it
+        match = re.search(r'Committed revision (\d+)', output.decode('UTF-8'))
+        if match:
+            return match.group(1)
 
         return self.latest_commit()
 
@@ -89,6 +89,15 @@ class Cli():
         assert result.exit_code == 0
         return result.output.strip()
 
+    # Fetch the states of an element and its dependencies
+    # with a single invocation of bst show on the project
+    #
+    # Returns:
+    #    (dict): The element states, keyed by element name
+    #
+    def get_element_states(self, project, target, deps='all'):
+        return self.show_by_name(project, target, deps, '%{state}')
+
     # Fetch an element's cache key by invoking bst show
     # on the project with the CLI
     #
@@ -102,6 +111,36 @@ class Cli():
         assert result.exit_code == 0
         return result.output.strip()
 
+    # Fetch the cache keys of an element and its dependencies
+    # with a single invocation of bst show on the project
+    #
+    # Returns:
+    #    (dict): The element cache keys, keyed by element name
+    #
+    def get_element_keys(self, project, target, deps='all'):
+        return self.show_by_name(project, target, deps, '%{full-key}')
+
+    # Invoke bst show once for the given target and dependencies,
+    # and collect the formatted field for each element listed
+    #
+    # Returns:
+    #    (dict): The formatted field, keyed by element name
+    #
+    def show_by_name(self, project, target, deps, field):
+        result = self.run(project=project, silent=True, args=[
+            'show',
+            '--deps', deps,
+            '--format', '%{name}||' + field,
+            target
+        ])
+        assert result.exit_code == 0
+
+        values = {}
+        for line in result.output.strip().splitlines():
+            element_name, value = line.split('||', 1)
+            values[element_name] = value
+        return values
+
 
 # Main fixture
 #
@@ -118,8 +157,10 @@ def cli(tmpdir):
 def chdir(directory):
     old_dir = os.getcwd()
     os.chdir(directory)
-    yield
-    os.chdir(old_dir)
+    try:
+        yield
+    finally:
+        os.chdir(old_dir)
 
 
 @contextmanager
@@ -130,13 +171,16 @@ def environment(env):
         old_env[key] = os.environ.get(key)
         os.environ[key] = value
 
-    yield
-
-    for key, value in old_env.items():
-        if value is None:
-            del os.environ[key]
-        else:
-            os.environ[key] = value
+    # Restore the environment even if the invocation raised,
+    # so that later tests do not inherit these variables
+    try:
+        yield
+    finally:
+        for key, value in old_env.items():
+            if value is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = value
 
 
 @contextmanager